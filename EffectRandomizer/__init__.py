@@ -706,7 +706,7 @@ class SeededEffectRandomizer(SDKMod):
         self.parent = parent
         self.Name = self.Name.format(self.config["seed"])
         self.Description = "\n".join([
-            f"{scl.OPTION.Caption}: {self.config[scl.CONFIG_KEY]}"
+            f"{scl.OPTION.Caption}: {self.config.get(scl.CONFIG_KEY, False)}"
             for scl in self.parent.scrambler_classes
         ])
         self.SettingsInputs: Dict[str, str] = { "Enter" : "Enable",
@@ -735,7 +735,7 @@ class SeededEffectRandomizer(SDKMod):
         elif action == "Restore":
             self.parent.add_child(self)
             self.Description = "\n".join([
-                f"{scl.OPTION.Caption}: {self.config[scl.CONFIG_KEY]}"
+                f"{scl.OPTION.Caption}: {self.config.get(scl.CONFIG_KEY, False)}"
                 for scl in self.parent.scrambler_classes
             ])
             self.SettingsInputs = { "Enter" : "Enable",
@@ -776,18 +776,24 @@ class SeededEffectRandomizer(SDKMod):
         self.parent.set_active_child(self.config["seed"])
         super().Enable()
         if not self.rng:
+            if not any(self.config.get(scrambler_class.CONFIG_KEY, False)
+                       for scrambler_class in self.parent.scrambler_classes):
+                # Nothing to scramble, so skip the commit and item cleanup.
+                return
             self.rng = random.Random(self.config["seed"])
             items_dirty = False
             weapons_dirty = False
             for scrambler_class in self.parent.scrambler_classes:
                 if not Game.GetCurrent() in scrambler_class.SUPPORTS:
                     continue
+                # Draw a seed even for disabled scramblers, so that enabling
+                # one doesn't change the results of the others.
                 seed = self.rng.randrange(sys.maxsize)
-                # Generate a new rng for each scrambler so that patches to
-                # one don't affect existing saves for the others.
-                scrambler_rng = random.Random(seed)
 
-                if self.config[scrambler_class.CONFIG_KEY]:
+                if self.config.get(scrambler_class.CONFIG_KEY, False):
+                    # Generate a new rng for each scrambler so that patches to
+                    # one don't affect existing saves for the others.
+                    scrambler_rng = random.Random(seed)
                     scrambler = scrambler_class(self.changes)
                     scrambler.scramble(scrambler_rng)
                     if scrambler.SCRAMBLES_ITEMS:
@@ -857,6 +863,7 @@ class EffectRandomizer(SDKMod):
         self.children = {}
         self.Options = []
         self.scrambler_classes = []
+        self.config_options = []
         self.create_initial_options()
 
     def create_initial_options(self) -> None:
@@ -888,6 +895,8 @@ class EffectRandomizer(SDKMod):
         """
         if Game.GetCurrent() in scrambler_class.SUPPORTS:
             self.scrambler_classes.append(scrambler_class)
+            self.config_options.append(
+                (scrambler_class.CONFIG_KEY, scrambler_class.OPTION))
             self.Options.append(scrambler_class.OPTION)
 
     def create_seeded_instances(self) -> None:
@@ -895,13 +904,11 @@ class EffectRandomizer(SDKMod):
         Instantiates a child SeededEffectRandomizer for each known seed.
         """
         for config in self.children_option.CurrentValue.values():
-            child = SeededEffectRandomizer(parent=self, config=config)
-            self.children[config["seed"]] = child
-            RegisterMod(child)
-        if not self.active_child_option.CurrentValue is None:
+            self.create_child(config)
+        active_child = self.active_child_option.CurrentValue
+        if active_child is not None:
             self.SettingsInputPressed("Disable")
-            active_mod = self.children[self.active_child_option.CurrentValue]
-            active_mod.SettingsInputPressed("Enable")
+            self.children[active_child].SettingsInputPressed("Enable")
 
     def set_active_child(self, active_child: str) -> None:
         """
@@ -927,6 +934,23 @@ class EffectRandomizer(SDKMod):
         """
         self.active_child_option.CurrentValue = None
 
+    def create_child(self, config: Dict[str, Union[bool, int]]
+                     ) -> SeededEffectRandomizer:
+        """
+        Constructs a seeded child, tracks it, and registers it with the mod
+        manager.
+
+        Args:
+            config:  Dict containing the child's configuration.
+
+        Returns:
+            The new SeededEffectRandomizer instance.
+        """
+        child = SeededEffectRandomizer(parent=self, config=config)
+        self.add_child(child)
+        RegisterMod(child)
+        return child
+
     def add_child(self, child: SeededEffectRandomizer) -> None:
         """
         Adds a new child to the set of seeds being tracked.
@@ -937,8 +961,7 @@ class EffectRandomizer(SDKMod):
         seed = child.config["seed"]
         if not str(seed) in self.children_option.CurrentValue:
             self.children_option.CurrentValue[str(seed)] = child.config
-        if not seed in self.children:
-            self.children[seed] = child
+        self.children[seed] = child
 
     def delete_seed(self, seed: int) -> None:
         """
@@ -958,10 +981,9 @@ class EffectRandomizer(SDKMod):
         """
         Activates the unseeded instance and deactivates all seeded instances.
         """
-        if not self.active_child_option.CurrentValue is None:
-            self.children[
-                self.active_child_option.CurrentValue
-            ].SettingsInputPressed("Disable")
+        active_child = self.active_child_option.CurrentValue
+        if active_child is not None:
+            self.children[active_child].SettingsInputPressed("Disable")
             self.active_child_option.CurrentValue = None
         super().Enable()
 
@@ -980,20 +1002,21 @@ class EffectRandomizer(SDKMod):
         Returns:
             True if the hook should call the originally replaced function
         """
+        # Only record enabled scramblers; every seed's config is persisted in
+        # settings.json, and a missing key reads as disabled.
         config = {
-            scrambler_class.CONFIG_KEY : scrambler_class.OPTION.CurrentValue
-            for scrambler_class in self.scrambler_classes
+            config_key : True
+            for config_key, option in self.config_options
+            if option.CurrentValue
         }
         while True:
             config["seed"] = random.randrange(sys.maxsize)
-            if not config["seed"] in self.children:
+            if config["seed"] not in self.children:
                 break
 
         seed = config["seed"]
         unrealsdk.Log(f"Randomizing effects with seed '{seed}'")
-        new_child = SeededEffectRandomizer(parent=self, config=config)
-        self.add_child(new_child)
-        RegisterMod(new_child)
+        new_child = self.create_child(config)
         self.set_active_child(seed)
         new_child.SettingsInputPressed("Enable")
         return new_child.on_disable_loading_movie(caller, function, params)
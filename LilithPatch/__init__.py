@@ -26,21 +26,32 @@ class LilithPatch(SDKMod):
     def notify_teleported(self, caller: unrealsdk.UObject,
                           function: unrealsdk.UFunction,
                           params: unrealsdk.FStruct) -> bool:
-        # Create a fake, hidden target pawn for Phasewalk.
-        self.target = caller.SpawnForMap(
-            self.template.Class,
-            None,
-            "Phasewalk Target",
-            Vector(0,0,0),
-            Rotator(0,0,0),
-            self.template,
-            True
-        )
-        self.target.SetHidden(True)
+        # Create a fake, hidden target pawn for Phasewalk.  Reuse it across
+        # teleports within a map; only respawn if the game has cleaned it up.
+        if self.target is None or self.target.bDeleteMe:
+            self.target = caller.SpawnForMap(
+                self.template.Class,
+                None,
+                "Phasewalk Target",
+                Vector(0,0,0),
+                Rotator(0,0,0),
+                self.template,
+                True
+            )
+            self.target.SetHidden(True)
         # TODO: figure out how to keep the target from falling off the map
         
         return True
 
+    @Hook("WillowGame.WillowPlayerController.WillowClientShowLoadingMovie")
+    def on_map_unloading(self, caller: unrealsdk.UObject,
+                         function: unrealsdk.UFunction,
+                         params: unrealsdk.FStruct) -> bool:
+        # The old map is going away, and our pawn with it.  Don't touch it -
+        # just forget it, so the teleport into the new map spawns a fresh one.
+        self.target = None
+        return True
+
     @Hook("Engine.Pawn.FellOutOfWorld")
     def on_fell_out_of_world(self, caller: unrealsdk.UObject,
                              function: unrealsdk.UFunction,
@@ -64,5 +75,14 @@ class LilithPatch(SDKMod):
         )
         super().Enable()
 
+    def Disable(self) -> None:
+        # self.target is forgotten whenever a map starts unloading, so it is
+        # still safe to look at here.
+        if not self.target is None:
+            if not self.target.bDeleteMe:
+                self.target.Destroy()
+            self.target = None
+        super().Disable()
+
 
 RegisterMod(LilithPatch())
@@ -6,9 +6,12 @@ import sys
 import json
 import random
 import re
+from bisect import bisect_left
 from collections import namedtuple
 from dataclasses import dataclass, field
-from typing import Set, List, Dict, Generator, Union
+from functools import partial
+from itertools import chain
+from typing import Callable, Set, FrozenSet, List, Dict, Generator, Tuple, Union
 
 from ..ModManager import SDKMod, RegisterMod
 from Mods.ModMenu import Game, Hook, ModTypes, Options, EnabledSaveType, LoadModSettings, SaveModSettings
@@ -36,51 +39,84 @@ class UnlistedSkillException(Exception):
         self.skill_name = skill_name
 
         
-def patch_nth_degree() -> None:
+def find_behavior_sequence(provider_name : str) -> unrealsdk.FStruct:
     """
-    Fix game freeze when The Nth Degree is boosted more than +8.
-    """
-    nth_bpd = unrealsdk.FindObject(
-        "BehaviorProviderDefinition",
-        "GD_Tulip_Mechromancer_Skills.EmbraceChaos.TheNthDegree.BehaviorProviderDefinition_0"
-    )
-    if nth_bpd is None:
-        return
+    Look up the first behavior sequence of a BehaviorProviderDefinition.  The
+    object is fetched fresh on each call, since UObject references do not
+    survive a package reload.
 
-    nth_seq = nth_bpd.BehaviorSequences[0]
-    nth_seq.EventData2[0].OutputLinks.ArrayIndexAndLength = 327681
-    nth_seq.EventData2[1].OutputLinks.ArrayIndexAndLength = 262145
-    nth_seq.BehaviorData2[3].OutputLinks.ArrayIndexAndLength = 131075
-    nth_seq.ConsolidatedOutputLinkData[0].LinkIdAndLinkedBehavior = -16777213
-    nth_seq.ConsolidatedOutputLinkData[2].LinkIdAndLinkedBehavior = 5
-    nth_seq.ConsolidatedOutputLinkData[3].LinkIdAndLinkedBehavior = 16777218
-    nth_seq.ConsolidatedOutputLinkData[4].LinkIdAndLinkedBehavior = 33554432
-    nth_seq.ConsolidatedOutputLinkData[5].LinkIdAndLinkedBehavior = 1
-    
-    nth_seq.BehaviorData2[2].Behavior.bNoSkillStacking=True
+    Args:
+        provider_name:  Full object name of the BehaviorProviderDefinition.
 
-def unpatch_nth_degree() -> None:
+    Returns:
+        The provider's first BehaviorSequence, or None if it is not loaded.
     """
-    Undo the effects of patch_nth_degree.
+    bpd = unrealsdk.FindObject("BehaviorProviderDefinition", provider_name)
+    if bpd is None:
+        return None
+    return bpd.BehaviorSequences[0]
+
+# Describes a fix to a skill's behavior sequence.  events, behaviors and links
+# map the patch state (True when applied) to (index, value) pairs for the
+# EventData2 and BehaviorData2 OutputLinks.ArrayIndexAndLength fields and the
+# ConsolidatedOutputLinkData LinkIdAndLinkedBehavior fields.  The behavior at
+# index stacking_behavior has bNoSkillStacking set while the patch is applied.
+BehaviorPatch = namedtuple(
+    "BehaviorPatch",
+    ["provider", "events", "behaviors", "links", "stacking_behavior"])
+
+BEHAVIOR_PATCHES = {
+    # Fix game freeze when The Nth Degree is boosted more than +8.
+    "TheNthDegree" : BehaviorPatch(
+        provider = "GD_Tulip_Mechromancer_Skills.EmbraceChaos.TheNthDegree.BehaviorProviderDefinition_0",
+        events = {
+            True : ((0, 327681), (1, 262145)),
+            False : ((0, 262145), (1, 327681)),
+        },
+        behaviors = {
+            True : ((3, 131075),),
+            False : ((3, 131074),),
+        },
+        links = {
+            True : ((0, -16777213), (2, 5), (3, 16777218), (4, 33554432),
+                    (5, 1)),
+            False : ((0, -16777212), (2, 16777218), (3, 33554432), (4, 1),
+                     (5, 5)),
+        },
+        stacking_behavior = 2,
+    ),
+}
+
+def apply_behavior_patch(name : str, patched : bool) -> None:
+    """
+    Apply or undo one of the fixes in BEHAVIOR_PATCHES.
+
+    Args:
+        name:  Key of the fix in BEHAVIOR_PATCHES.
+        patched:  True to apply the fix, False to restore the original skill.
     """
-    nth_bpd = unrealsdk.FindObject(
-        "BehaviorProviderDefinition",
-        "GD_Tulip_Mechromancer_Skills.EmbraceChaos.TheNthDegree.BehaviorProviderDefinition_0"
-    )
-    if nth_bpd is None:
+    spec = BEHAVIOR_PATCHES[name]
+    sequence = find_behavior_sequence(spec.provider)
+    if sequence is None:
         return
+    # bNoSkillStacking doubles as the record of which state the sequence is
+    # in.  Reading it from the engine rather than a module flag stays correct
+    # if the mod is reloaded while the patch is applied.
+    behaviors = sequence.BehaviorData2
+    stacking_behavior = behaviors[spec.stacking_behavior].Behavior
+    if stacking_behavior.bNoSkillStacking == patched:
+        return
+
+    events = sequence.EventData2
+    for index, value in spec.events[patched]:
+        events[index].OutputLinks.ArrayIndexAndLength = value
+    for index, value in spec.behaviors[patched]:
+        behaviors[index].OutputLinks.ArrayIndexAndLength = value
+    links = sequence.ConsolidatedOutputLinkData
+    for index, value in spec.links[patched]:
+        links[index].LinkIdAndLinkedBehavior = value
     
-    nth_seq = nth_bpd.BehaviorSequences[0]
-    nth_seq.EventData2[0].OutputLinks.ArrayIndexAndLength = 262145
-    nth_seq.EventData2[1].OutputLinks.ArrayIndexAndLength = 327681
-    nth_seq.BehaviorData2[3].OutputLinks.ArrayIndexAndLength = 131074
-    nth_seq.ConsolidatedOutputLinkData[0].LinkIdAndLinkedBehavior = -16777212
-    nth_seq.ConsolidatedOutputLinkData[2].LinkIdAndLinkedBehavior = 16777218
-    nth_seq.ConsolidatedOutputLinkData[3].LinkIdAndLinkedBehavior = 33554432
-    nth_seq.ConsolidatedOutputLinkData[4].LinkIdAndLinkedBehavior = 1
-    nth_seq.ConsolidatedOutputLinkData[5].LinkIdAndLinkedBehavior = 5
-    
-    nth_seq.BehaviorData2[2].Behavior.bNoSkillStacking=False
+    stacking_behavior.bNoSkillStacking = patched
 
 
 class Dependency:
@@ -89,18 +125,24 @@ class Dependency:
     one or more skills; it can grant zero or more 'free' skills when satisfied;
     it can be required by zero or more skills; and it can be wanted by skills
     that are documented to need it but don't actually require it to function.
+    Skill names are interned, as they are used repeatedly as dictionary keys.
+    Dependers and wanters are only ever tested for membership, so they are
+    stored as frozensets.  Providers and granted skills are fixed once built,
+    so they are tuples; providers keep their order for random selection.
     """
 
+    __slots__ = ("name", "providers", "extra_skills", "dependers", "wanters")
+
     def __init__(self, name : str) -> None:
         """
         Args:
             name : A human-friendly label for the dependency.  Used for logging.
         """
         self.name = name
-        self.providers = []
-        self.extra_skills = []
-        self.dependers = []
-        self.wanters = []
+        self.providers = ()
+        self.extra_skills = ()
+        self.dependers = frozenset()
+        self.wanters = frozenset()
 
     def provided_by(self, providers : List[str]) -> Dependency:
         """
@@ -112,7 +154,7 @@ class Dependency:
         Returns:
             The Dependency, so that other builders can be chained.
         """
-        self.providers = providers
+        self.providers = tuple(sys.intern(skill) for skill in providers)
         return self
 
     def grants(self, extra_skills : List[str]) -> Dependency:
@@ -126,7 +168,7 @@ class Dependency:
         Returns:
             The Dependency, so that other builders can be chained.
         """
-        self.extra_skills = extra_skills
+        self.extra_skills = tuple(sys.intern(skill) for skill in extra_skills)
         return self
 
     def required_by(self, dependers : List[str]) -> Dependency:
@@ -140,7 +182,7 @@ class Dependency:
         Returns:
             The Dependency, so that other builders can be chained.
         """
-        self.dependers = dependers
+        self.dependers = frozenset(sys.intern(skill) for skill in dependers)
         return self
 
     def wanted_by(self, wanters : List[str]) -> Dependency:
@@ -154,7 +196,7 @@ class Dependency:
         Returns:
             The Dependency, so that other builders can be chained.
         """
-        self.wanters = wanters
+        self.wanters = frozenset(sys.intern(skill) for skill in wanters)
         return self
 
 
@@ -163,10 +205,14 @@ class CharacterHint:
     Stores any quirks about a character when using it with the PlayerRandomizer.
     """
 
+    __slots__ = ("dependencies", "suppressed_skills", "patch_functions",
+                 "unpatch_functions")
+
     def __init__(self) -> None:
         self.dependencies = []
-        self.suppressed_skills = []
-        self.patches = []
+        self.suppressed_skills = frozenset()
+        self.patch_functions = []
+        self.unpatch_functions = []
 
     def add_dependency(self, dependency : Dependency) -> CharacterHint:
         """
@@ -194,7 +240,8 @@ class CharacterHint:
         Returns:
             The CharacterHint, so that other builders can be chained.
         """
-        self.suppressed_skills = suppressed_skills
+        self.suppressed_skills = frozenset(
+            sys.intern(skill) for skill in suppressed_skills)
         return self
 
     def patch(self, patch_function : Callable[None, None],
@@ -212,7 +259,8 @@ class CharacterHint:
         Returns:
             The CharacterHint, so that other builders can be chained.
         """
-        self.patches.append((patch_function, unpatch_function))
+        self.patch_functions.append(patch_function)
+        self.unpatch_functions.append(unpatch_function)
         return self
 
             
@@ -235,14 +283,8 @@ class Character:
         self.character_name = None
         self.attribute_package = None
         self.is_custom = False
-
-        self.skill_option = Options.Boolean(
-            Caption = "TBD",
-            Description = "Add skills for TBD to the selection pool.",
-            StartingValue = True,
-            Choices = ("No", "Yes"),
-            IsHidden = False,
-        )
+        # Created by update() once the character's name is known.
+        self.skill_option = None
 
     def update(self, class_def : unrealsdk.UObject) -> Bool:
         """
@@ -258,16 +300,29 @@ class Character:
         """
         if self.character_name != class_def.CharacterNameId.CharacterName:
             self.character_name = class_def.CharacterNameId.CharacterName
-            self.skill_option.Caption = f"Use {self.character_name} Skills"
-            self.skill_option.Description = f"Add skills for {self.character_name} to the selection pool."
+            caption = f"Use {self.character_name} Skills"
+            description = f"Add skills for {self.character_name} to the selection pool."
+            if self.skill_option is None:
+                self.skill_option = Options.Boolean(
+                    Caption = caption,
+                    Description = description,
+                    StartingValue = True,
+                    Choices = ("No", "Yes"),
+                    IsHidden = False,
+                )
+            else:
+                # The option may already be in the menu; rename it in place.
+                self.skill_option.Caption = caption
+                self.skill_option.Description = description
             self.action_skill = None
             self.pure_skills = []
             self.extra_skills = []
             self.suppressed_skills = []
             self.misdocumented_skills = []
-            self.suppressed_skill_names = []
+            self.suppressed_skill_names = frozenset()
             self.dependencies = []
-            self.patches = []
+            self.patch_functions = []
+            self.unpatch_functions = []
             return True
         return False
         
@@ -291,12 +346,12 @@ class Character:
                         continue
                     yield skill
 
-    def get_suppressed_skills(self) -> List(Skill):
+    def get_suppressed_skills(self) -> FrozenSet[str]:
         """
-        Retrieve the list of skills eliminated from consideration.
+        Retrieve the names of skills eliminated from consideration.
 
         Returns:
-            The list of skills eliminated from consideration.
+            The object names of skills eliminated from consideration.
         """
         return self.suppressed_skill_names
 
@@ -352,14 +407,14 @@ class Character:
         """
         Apply all applicable patches to the skill pool for this player class.
         """
-        for patch, _ in self.patches:
+        for patch in self.patch_functions:
             patch()
 
     def remove_patches(self) -> None:
         """
         Remove all applicable patches from the skill pool for this player class.
         """
-        for _, unpatch in self.patches:
+        for unpatch in self.unpatch_functions:
             unpatch()
 
 
@@ -372,6 +427,17 @@ class Characters:
         self.char_by_name = {}
         self.char_by_cls = {}
         self.has_custom_char = False
+        self.hints = {}
+
+    # Internal code-name prefixes of DLC characters, mapped to the base class
+    # name used in their object paths.
+    class_aliases : Dict[str, str] = {
+        "Lilac" : "Psycho",
+        "Tulip" : "Mechromancer",
+        "Doppel" : "Doppelganger",
+    }
+    class_alias_lengths : List[int] = sorted(
+        {len(prefix) for prefix in class_aliases})
 
     @staticmethod
     def class_from_obj_name(name: str) -> str:
@@ -384,16 +450,14 @@ class Characters:
         Returns:
             The base class name associated with the UObject.
         """
-        elements = name.split("_")
-        if len(elements) < 2:
+        _, separator, rest = name.partition("_")
+        if not separator:
             return None
-        char = elements[1]
-        if char.startswith("Lilac"):
-            char = "Psycho"
-        elif char.startswith("Tulip"):
-            char = "Mechromancer"
-        elif char.startswith("Doppel"):
-            char = "Doppelganger"
+        char, _, _ = rest.partition("_")
+        for length in Characters.class_alias_lengths:
+            alias = Characters.class_aliases.get(char[:length])
+            if not alias is None:
+                return alias
         return char
         
     def update(self) -> Bool:
@@ -404,7 +468,7 @@ class Characters:
             True if any of the character classes changed since the last update.
         """
         changed = False
-        self.char_by_name = {}
+        self.char_by_name.clear()
         for class_def in unrealsdk.FindAll("PlayerClassDefinition"):
             if not class_def.CharacterNameId is None:
                 char_class = Characters.class_from_obj_name(
@@ -417,11 +481,12 @@ class Characters:
                 if character.update(class_def):
                     # Name changed.  Need to reread skills.
                     changed = True
-                    if character.character_name in self.hint_map:
-                        hint = self.hint_map[character.character_name]
+                    hint = self.get_hint(character.character_name)
+                    if not hint is None:
                         character.dependencies = hint.dependencies
                         character.suppressed_skill_names = hint.suppressed_skills
-                        character.patches = hint.patches
+                        character.patch_functions = hint.patch_functions
+                        character.unpatch_functions = hint.unpatch_functions
                         character.is_custom = False
                     else:
                         character.is_custom = True
@@ -440,6 +505,29 @@ class Characters:
 
         return changed
 
+    def get_hint(self, name : str) -> CharacterHint:
+        """
+        Given a character name, return the associated CharacterHint, building
+        it on first use.
+
+        Args:
+            name : Name of the Character whose hint is being requested.
+
+        Returns:
+            The associated CharacterHint, or None if name is not a known
+            character.
+        """
+        try:
+            return self.hints[name]
+        except KeyError:
+            pass
+        builder = self.hint_builders.get(name, None)
+        if builder is None:
+            return None
+        hint = builder()
+        self.hints[name] = hint
+        return hint
+
     def from_name(self, name : str) -> Character:
         """
         Given a character name, return the associated Character.
@@ -483,9 +571,11 @@ class Characters:
         for character in self.char_by_name.values():
             yield character
 
-    hint_map : Dict(str, CharacterHint) = {
+    # Builders for the CharacterHints of known characters.  Hints are only
+    # constructed when a character is first seen; see get_hint().
+    hint_builders : Dict[str, Callable[[], CharacterHint]] = {
         # BL2
-        "Axton" : CharacterHint().add_dependency(Dependency(
+        "Axton" : lambda: CharacterHint().add_dependency(Dependency(
             "Scorpio"
         ).provided_by([
             "GD_Soldier_Skills.Scorpio.Skill_Scorpio",
@@ -503,7 +593,7 @@ class Characters:
             "GD_Soldier_Skills.Survival.PhalanxShield",
         ])),
 
-        "Gaige" : CharacterHint().add_dependency(Dependency(
+        "Gaige" : lambda: CharacterHint().add_dependency(Dependency(
             "DeathTrap"
         ).provided_by([
             "GD_Tulip_Mechromancer_Skills.Action.Skill_DeathTrap",
@@ -537,7 +627,7 @@ class Characters:
             "GD_Tulip_Mechromancer_Skills.EmbraceChaos.DeathFromAbove",
         ])),
 
-        "Krieg" : CharacterHint().add_dependency(Dependency(
+        "Krieg" : lambda: CharacterHint().add_dependency(Dependency(
             "BuzzAxe"
         ).provided_by([
             "GD_Lilac_SkillsBase.ActionSkill.Skill_Psycho",
@@ -586,7 +676,7 @@ class Characters:
             "GD_Lilac_Skills_Bloodlust.Skills.FuelTheBloodChild",
         ]),
 
-        "Maya" : CharacterHint().add_dependency(Dependency(
+        "Maya" : lambda: CharacterHint().add_dependency(Dependency(
             "Phaselock"
         ).provided_by([
             "GD_Siren_Skills.Phaselock.Skill_Phaselock",
@@ -604,9 +694,10 @@ class Characters:
             "GD_Siren_Skills.Cataclysm.ChainReaction",
             "GD_Siren_Skills.Harmony.SweetRelease",
             "GD_Siren_Skills.Motion.Converge",
-        ])).patch(patch_nth_degree, unpatch_nth_degree),
+        ])).patch(partial(apply_behavior_patch, "TheNthDegree", True),
+                  partial(apply_behavior_patch, "TheNthDegree", False)),
 
-        "Salvador" : CharacterHint().add_dependency(Dependency(
+        "Salvador" : lambda: CharacterHint().add_dependency(Dependency(
             "Gunzerk"
         ).provided_by([
             "GD_Mercenary_Skills.ActionSkill.Skill_Gunzerking",
@@ -627,7 +718,7 @@ class Characters:
             "GD_Mercenary_Skills.Rampage.SteadyAsSheGoes",
         ])),
 
-        "Zero" : CharacterHint().add_dependency(Dependency(
+        "Zero" : lambda: CharacterHint().add_dependency(Dependency(
             "Deception"
         ).provided_by([
             "GD_Assassin_Skills.ActionSkill.Skill_Deception",
@@ -641,7 +732,7 @@ class Characters:
         ])),
 
         # TPS
-        "Athena" : CharacterHint().add_dependency(Dependency(
+        "Athena" : lambda: CharacterHint().add_dependency(Dependency(
             "Aspis"
         ).provided_by([
             "GD_Gladiator_Skills.ActionSkill.Skill_Gladiator",
@@ -685,7 +776,7 @@ class Characters:
             "GD_Gladiator_Skills.CeraunicStorm.Unrelenting",
         ])),
 
-        "Aurelia" : CharacterHint().add_dependency(Dependency(
+        "Aurelia" : lambda: CharacterHint().add_dependency(Dependency(
             "Frost Shard"
         ).provided_by([
             "Crocus_Baroness_ActionSkill.ActionSkill.Skill_ColdAsIce",
@@ -711,7 +802,7 @@ class Characters:
             "Crocus_Baroness_Servant.Skills.YouFirst",
         ])),
                        
-        "Claptrap" : CharacterHint().add_dependency(Dependency(
+        "Claptrap" : lambda: CharacterHint().add_dependency(Dependency(
             "VaultHunter.EXE"
         ).provided_by([
             "GD_Prototype_Skills_GBX.ActionSkill.Skill_VaultHunterEXE",
@@ -719,7 +810,7 @@ class Characters:
             "GD_Prototype_Skills.ILoveYouGuys.ThroughThickAndThin",
         ])),
 
-        "Jack" : CharacterHint().add_dependency(Dependency(
+        "Jack" : lambda: CharacterHint().add_dependency(Dependency(
             "Expendable Assets"
         ).provided_by([
             "Quince_Doppel_Skills.ActionSkill.Skill_SummonDigiJack",
@@ -744,7 +835,7 @@ class Characters:
             "Quince_Doppel_Streaming.ActionSkill.Skill_Doppelganging",
         ]),
 
-        "Nisha" : CharacterHint().add_dependency(Dependency(
+        "Nisha" : lambda: CharacterHint().add_dependency(Dependency(
             "Showdown"
         ).provided_by([
             "GD_Lawbringer_Skills.ActionSkill.Skill_Showdown",
@@ -781,7 +872,7 @@ class Characters:
             "GD_Lawbringer_Skills.FanTheHammer.HellsCominWithMe_Effect",
         ]),
 
-        "Wilhelm" : CharacterHint().add_dependency(Dependency(
+        "Wilhelm" : lambda: CharacterHint().add_dependency(Dependency(
             "Drones"
         ).provided_by([
             "GD_Enforcer_Skills.ActionSkill.Skill_AirPower",
@@ -813,6 +904,11 @@ class Skill:
     Stores skill information in a format safe from the UE memory manager.
     """
 
+    __slots__ = ("name", "full_name", "is_player_skill", "is_action_skill",
+                 "character", "max_grade", "skill_name", "_attribute_def",
+                 "free_attribute_def", "_presentation", "free_presentation",
+                 "presentation_name", "player_resolver", "context_resolver", "value_resolver")
+
     def __init__(self,
                  skill_def : unrealsdk.UObject,
                  characters : Characters) -> None:
@@ -822,17 +918,16 @@ class Skill:
             characters:  Pool of playable characters
         """
         self.name = skill_def.Name
-        self.full_name = skill_def.GetObjectName()
+        # Interned to match the skill names held by Dependency and
+        # CharacterHint, which are compared against it as dictionary keys.
+        self.full_name = sys.intern(skill_def.GetObjectName())
         self.is_player_skill = False
         self.is_action_skill = False
         self.character = None
-        if not (skill_def.SkillIcon is None or
-                skill_def.SkillName is None or
-                skill_def.SkillDescription is None or
-                skill_def.bSubjectToGradeRules == False):
+        if Skill.is_player_skill_def(skill_def):
             self.is_player_skill = True
             self.is_action_skill = (
-                skill_def.SkillType == ESkillType.SKILL_TYPE_Action)
+                skill_def.SkillType == self.action_skill_type)
             self.max_grade = skill_def.MaxGrade
             char_class = Characters.class_from_obj_name(self.full_name)
             self.character = characters.from_cls(char_class)
@@ -842,6 +937,25 @@ class Skill:
         self.free_attribute_def = False
         self._presentation = None
         self.free_presentation = False
+        self.presentation_name = None
+
+    @staticmethod
+    def is_player_skill_def(skill_def : unrealsdk.UObject) -> bool:
+        """
+        Determines if a SkillDefinition is a skill a player can pick, without
+        building a Skill for it.
+
+        Args:
+            skill_def:  The SkillDefinition to check.
+
+        Returns:
+            True if the skill has an icon, name and description and is
+                subject to grade rules.
+        """
+        return not (skill_def.SkillIcon is None or
+                    skill_def.SkillName is None or
+                    skill_def.SkillDescription is None or
+                    skill_def.bSubjectToGradeRules == False)
 
     @property
     def skill_def(self) -> unrealsdk.UObject:
@@ -899,7 +1013,7 @@ class Skill:
                 Outer=package,
                 Name=self.name,
                 Template=self.attribute_def_template)
-            self._attribute_def.AttributeDataType = EAttributeDataType.ADT_Int
+            self._attribute_def.AttributeDataType = self.int_data_type
             unrealsdk.KeepAlive(self._attribute_def)
 
             self.player_resolver = unrealsdk.ConstructObject(
@@ -968,9 +1082,11 @@ class Skill:
                 Template=self.presentation_template)
             unrealsdk.KeepAlive(self._presentation)
             self.free_presentation = True
-            self._presentation.RoundingMode = EAttributeInitializationRounding.ATTRROUNDING_IntFloor
+            self._presentation.RoundingMode = self.floor_rounding
             self._presentation.bDisplayAsPercentage = False
             self._presentation.Attribute = self.attribute_def
+            self.presentation_name = self.format_presentation_name(
+                self._presentation)
 
             # Modder-style i18n:  Luckily the Description field always follows
             # a particular format in each language.  As localization has already
@@ -979,7 +1095,8 @@ class Skill:
             # template.
             skill_name = self.skill_name  # localized
             language = self._presentation.GetLanguage()
-            desc = eval(f"f'{self.skill_localization[language]}'")
+            desc = self.skill_localization[language].format(
+                skill_name=skill_name)
             # We have to use the console to set the string, because the game
             # crashes if we try to set the description directly.
             unrealsdk.GetEngine().GamePlayers[0].Actor.ConsoleCommand(
@@ -999,6 +1116,23 @@ class Skill:
         """
         self._presentation = preso_def
         self.free_presentation = False
+        self.presentation_name = (
+            None if preso_def is None
+            else self.format_presentation_name(preso_def))
+
+    @staticmethod
+    def format_presentation_name(preso_def: unrealsdk.UObject) -> str:
+        """
+        Formats an AttributePresentationDefinition the way the console expects
+        it in an object list, e.g. Class'Package.Object'.
+
+        Args:
+            preso_def : The AttributePresentationDefinition to format.
+
+        Returns:
+            The console-ready name of the definition.
+        """
+        return preso_def.GetFullName().replace(" ", "'") + "'"
 
     # Class archetypes and common packages are around from the start of the game
     # and don't get freed or swapped out, so it's safe to cache them.
@@ -1021,6 +1155,11 @@ class Skill:
         "AttributePresentationDefinition",
         "WillowGame.Default__AttributePresentationDefinition")
 
+    # Enum values are likewise fixed, so look them up once.
+    action_skill_type = ESkillType.SKILL_TYPE_Action
+    int_data_type = EAttributeDataType.ADT_Int
+    floor_rounding = EAttributeInitializationRounding.ATTRROUNDING_IntFloor
+
     skill_localization = {
         "DEU" : "{skill_name}-Skill",
         "ESN" : "Habilidad {skill_name}",
@@ -1048,6 +1187,8 @@ class SkillCatalog:
         Indicate that the SkillCatalog needs to reload skill data.
         """
         self.dirty = True
+        # Skill trees may have changed along with the skills.
+        Branch.originals.clear()
 
     def find_skills(self, characters: Characters) -> None:
         """
@@ -1079,12 +1220,12 @@ class SkillCatalog:
         # Now go through all skills, determine which are player skills,
         # and add them as either misdocumented or suppressed skills.
         for skill_def in unrealsdk.FindAll("SkillDefinition"):
-            skill = Skill(skill_def, characters)
-            if not skill.is_player_skill:
+            if not Skill.is_player_skill_def(skill_def):
                 continue
-            if skill.full_name in self.skills:
+            if skill_def.GetObjectName() in self.skills:
                 # already listed in a skill tree
                 continue
+            skill = Skill(skill_def, characters)
             if skill.is_action_skill:
                 # This actually happens for Jack in TPS - there's a skill that
                 # looks like an earlier version of Expendable Assets.  Not
@@ -1111,8 +1252,8 @@ class SkillCatalog:
                 # attribute doesn't represent a skill
                 continue
             resolver = attribute_def.ContextResolverChain[1]
-            skill_name = ".".join(
-                resolver.AssociatedSkillPathName.PathComponentnames[3:6])
+            components = resolver.AssociatedSkillPathName.PathComponentNames
+            skill_name = f"{components[3]}.{components[4]}.{components[5]}"
             if skill_name in self.skills:
                 self.skills[skill_name].attribute_def = attribute_def
 
@@ -1127,6 +1268,15 @@ class SkillCatalog:
         """
         Collect AttributePresentationDefinitions for each skill.
         """
+        # Index skills by the attribute definitions they already have.  Read
+        # _attribute_def directly: the property would construct definitions
+        # for every skill, and new ones can't have presentations yet anyway.
+        skills_by_attribute = {}
+        for skill in self.skills.values():
+            if not skill._attribute_def is None:
+                skills_by_attribute.setdefault(
+                    skill._attribute_def.GetObjectName(), skill)
+
         for presentation in unrealsdk.FindAll(
                 "AttributePresentationDefinition"
         ):
@@ -1135,10 +1285,9 @@ class SkillCatalog:
                 continue
             # I could go through ContextResolverChain[1].AssociatedSkillPathName
             # but this is probably easier and safer.
-            for skill in self.skills.values():
-                if skill.attribute_def == attribute_def:
-                    skill.presentation = presentation
-                    break
+            skill = skills_by_attribute.get(attribute_def.GetObjectName(), None)
+            if not skill is None:
+                skill.presentation = presentation
 
     def flatten_presentations(self) -> None:
         """
@@ -1154,20 +1303,21 @@ class SkillCatalog:
         presentation_list: unrealsdk.UObject = unrealsdk.FindObject(
             "AttributePresentationListDefinition",
             "GD_AttributePresentation._AttributeList.DefaultPresentationList")
-        self.original_plist = [
+        self.original_plist = tuple(
             "None" if presentation is None
-            else presentation.GetFullName().replace(" ", "'") + "'"
+            else Skill.format_presentation_name(presentation)
             for presentation in presentation_list.Attributes
-        ]
-        replacement_plist = self.original_plist[:]
+        )
+        listed = set(self.original_plist)
+        added_plist = []
         for skill in self.skills.values():
             if skill.presentation is None:
                 continue
-            presentation_name = skill.presentation.GetFullName().replace(
-                " ","'") + "'"
-            if not presentation_name in replacement_plist:
-                replacement_plist.append(presentation_name)
-        console_value = ", ".join(replacement_plist)
+            presentation_name = skill.presentation_name
+            if not presentation_name in listed:
+                listed.add(presentation_name)
+                added_plist.append(presentation_name)
+        console_value = ", ".join(chain(self.original_plist, added_plist))
         unrealsdk.GetEngine().GamePlayers[0].Actor.ConsoleCommand(
             f"set GD_AttributePresentation._AttributeList.DefaultPresentationList Attributes ({console_value})")
 
@@ -1188,22 +1338,31 @@ class Branch:
     @classmethod
     def from_branch(self, branch: unrealsdk.UObject) -> Branch:
         """
-        Creates a Branch from a non-action SkillTreeBranchDefinition.
+        Creates a Branch from a non-action SkillTreeBranchDefinition.  The
+        contents are read from the engine only the first time a branch is
+        seen; after that the same Branch is returned until the SkillCatalog is
+        marked dirty.  Callers must not modify the returned Branch.
 
         Args:
             branch:  The SkillTreeBranchDefinition to base this Branch on.
 
         Returns:
-            A new Branch object representing the SkillTreeBranchDefinition.
+            A Branch object representing the original SkillTreeBranchDefinition.
         """
+        full_name = branch.GetObjectName()
+        try:
+            return Branch.originals[full_name]
+        except KeyError:
+            pass
         new_branch = Branch()
-        new_branch.full_name = branch.GetObjectName()
+        new_branch.full_name = full_name
         new_branch.layout_name = branch.Layout.GetObjectName()
         for tier in branch.Tiers:
             new_branch.skills.append([skill.GetObjectName() for skill in tier.Skills if not skill is None])
             new_branch.points_to_unlock.append(tier.PointsToUnlockNextTier)
         for tier in branch.Layout.Tiers:
             new_branch.layout.append([flag for flag in tier.bCellIsOccupied])
+        Branch.originals[full_name] = new_branch
         return new_branch
 
     @classmethod
@@ -1224,6 +1383,27 @@ class Branch:
         new_branch.points_to_unlock = other.points_to_unlock[:]
         new_branch.layout = [tier[:] for tier in other.layout]
         return new_branch
+
+    @classmethod
+    def from_shape(self, other: Branch) -> Branch:
+        """
+        Creates an empty Branch for the same definitions as another Branch,
+        with the same number of tiers.  Use this for branches whose tiers will
+        all be overwritten.
+
+        Args:
+            other:  The Branch to take names and tier counts from.
+
+        Returns:
+            A new Branch object with empty tiers.
+        """
+        new_branch = Branch()
+        new_branch.full_name = other.full_name
+        new_branch.layout_name = other.layout_name
+        new_branch.skills = [[] for _ in other.skills]
+        new_branch.points_to_unlock = [0] * len(other.points_to_unlock)
+        new_branch.layout = [[False, False, False] for _ in other.layout]
+        return new_branch
     
     def __init__(self) -> None:
         self.skills = []
@@ -1231,24 +1411,30 @@ class Branch:
         self.layout = []
         self.full_name = None
         self.layout_name = None
+
+    # Branches as first read from the engine, keyed by object name.  Cleared
+    # by SkillCatalog.mark_dirty.
+    originals : Dict[str, Branch] = {}
         
     def patch(self) -> None:
         """
         Writes the Branch into the game engine.
         """
-        command = f"set SkillTreeBranchDefinition'{self.full_name}' Tiers ("
-        command += ",".join(["(Skills=(" + ",".join([
-            f"SkillDefinition'{tier_skill}'"
-            for tier_skill in tier_skills]) +
-                             f"),PointsToUnlockNextTier={unlock})"
-                             for tier_skills, unlock
-                             in zip(self.skills, self.points_to_unlock)]) + ")"
-        unrealsdk.GetEngine().GamePlayers[0].Actor.ConsoleCommand(command)
-        command = f"set SkillTreeBranchLayoutDefinition'{self.layout_name}' Tiers ("
-        command += ",".join(["(bCellIsOccupied=(" + ",".join([
-            str(skill_present) for skill_present in tier_layout])
-                             + "))" for tier_layout in self.layout]) + ")"
-        unrealsdk.GetEngine().GamePlayers[0].Actor.ConsoleCommand(command)
+        console_command = unrealsdk.GetEngine().GamePlayers[0].Actor.ConsoleCommand
+        tiers = ",".join(
+            "(Skills=({}),PointsToUnlockNextTier={})".format(
+                ",".join(f"SkillDefinition'{tier_skill}'"
+                         for tier_skill in tier_skills),
+                unlock)
+            for tier_skills, unlock in zip(self.skills, self.points_to_unlock))
+        command = f"set SkillTreeBranchDefinition'{self.full_name}' Tiers ({tiers})"
+        console_command(command)
+        tiers = ",".join(
+            "(bCellIsOccupied=({}))".format(
+                ",".join(str(skill_present) for skill_present in tier_layout))
+            for tier_layout in self.layout)
+        command = f"set SkillTreeBranchLayoutDefinition'{self.layout_name}' Tiers ({tiers})"
+        console_command(command)
 
 
 class SkillPool:
@@ -1263,6 +1449,8 @@ class SkillPool:
         """
         self.rng = rng
         self.dependencies = {}
+        self.dependents = {}
+        self.satisfied = set()
         self.skills = {}
         self.skill_order = None
         self.extra_skills = []
@@ -1291,6 +1479,12 @@ class SkillPool:
         """
         for skill_name in dependency.providers:
             self.dependencies[skill_name] = dependency
+        if not dependency.providers:
+            return
+        # Index the dependency by the skills that need it, so get_next_skill
+        # doesn't have to scan every outstanding dependency per candidate.
+        for skill_name in dependency.dependers | dependency.wanters:
+            self.dependents.setdefault(skill_name, []).append(dependency)
 
     def mark_used(self, skill: Skill) -> Skill:
         """
@@ -1302,16 +1496,15 @@ class SkillPool:
         Returns:
             The removed Skill.
         """
-        
-        if skill.full_name in self.dependencies:
-            dependency = self.dependencies[skill.full_name]
+        skill_name = skill.full_name
+        dependency = self.dependencies.get(skill_name, None)
+        if not dependency is None and not dependency in self.satisfied:
             # Save any 'free' skills granted by the initial one.
             self.extra_skills.extend(dependency.extra_skills)
-            for skill_name in dependency.providers:
-                del self.dependencies[skill_name]
-        if skill.full_name in self.skills:
-            del self.skills[skill.full_name]
-            self.skill_order.remove(skill.full_name)
+            self.satisfied.add(dependency)
+        if not self.skills.pop(skill_name, None) is None:
+            # skill_order is sorted, so find the entry by bisection.
+            del self.skill_order[bisect_left(self.skill_order, skill_name)]
         return skill
 
     def get_next_skill(self, hidden_skills) -> Skill:
@@ -1330,7 +1523,9 @@ class SkillPool:
             skill_name = self.rng.choice(self.skill_order)
             if hidden_skills == "All":
                 return self.mark_used(self.skills[skill_name])
-            for dependency in self.dependencies.values():
+            for dependency in self.dependents.get(skill_name, []):
+                if dependency in self.satisfied:
+                    continue
                 if ((hidden_skills == "None" and
                      skill_name in dependency.wanters) or
                     skill_name in dependency.dependers):
@@ -1401,8 +1596,7 @@ class SkillPool:
                 raise UnlistedSkillException(skill_name)
 
         # Sort the current skill list for reproducibility.
-        self.skill_order = list(self.skills)
-        self.skill_order.sort()
+        self.skill_order = sorted(self.skills)
 
         if config["action_skill"] == "Default":
             if current_char is None:
@@ -1436,7 +1630,8 @@ class SkillPool:
         self.original_branches = []
         for branch in skill_tree.Root.Children:
             old_branch = Branch.from_branch(branch)
-            new_branch = Branch.from_other(old_branch)
+            # randomize_branch rewrites every tier, so skip copying them.
+            new_branch = Branch.from_shape(old_branch)
             self.original_branches.append(old_branch)
 
             wanted += self.randomize_branch(
@@ -1590,6 +1785,10 @@ class ClassModPatcher:
     def __init__(self):
         self.original = {}
         self.coms = None
+        # ClassModDefinitions found by the last record_coms call.  These are
+        # only valid until control returns to the game, so use them only
+        # within the hook that recorded them.
+        self.com_objects = {}
 
     @staticmethod
     def iterate_coms(
@@ -1603,16 +1802,21 @@ class ClassModPatcher:
         Yields:
             A ClassModDefinition assigned to the specified char_class.
         """
-        for com in unrealsdk.FindAll("ClassModDefinition"):
-            if com.RequiredPlayerClass is None:
-                continue
-            if com.RequiredPlayerClass.Name == char_class:
-                yield com
-
-        # DLC classmods referencing another DLC use the CMDef subclass instead.
-        for com in unrealsdk.FindAll("CrossDLCClassModDefinition"):
-            if com.RequiredPlayerClassPathName.PathComponentNames[5] == char_class:
-                yield com
+        # One scan covers both kinds of COM.  DLC classmods referencing another
+        # DLC use the CMDef subclass instead; those are yielded after the
+        # regular ones, matching the order of separate scans.
+        cross_dlc_coms = []
+        for com in unrealsdk.FindAll("ClassModDefinition", True):
+            com_type = com.Class.Name
+            if com_type == "ClassModDefinition":
+                if com.RequiredPlayerClass is None:
+                    continue
+                if com.RequiredPlayerClass.Name == char_class:
+                    yield com
+            elif com_type == "CrossDLCClassModDefinition":
+                if com.RequiredPlayerClassPathName.PathComponentNames[5] == char_class:
+                    cross_dlc_coms.append(com)
+        yield from cross_dlc_coms
 
     def record_coms(self, char_class: str) -> None:
         """
@@ -1622,18 +1826,22 @@ class ClassModPatcher:
             char_class:  Character class whose COMs should be archived
         """
         self.coms = {}
+        self.com_objects = {}
         for com in ClassModPatcher.iterate_coms(char_class):
-            skill_slot_map = {}
-            self.coms[com.GetObjectName()] = skill_slot_map
+            com_name = com.GetObjectName()
+            # (slot index, original attribute name) for each skill slot.
+            skill_slots = []
+            self.coms[com_name] = skill_slots
+            self.com_objects[com_name] = com
             slot_index = 0
             for attribute_slot in com.AttributeSlotEffects:
                 if attribute_slot.SlotName.startswith("Skill"):
                     if attribute_slot.AttributeToModify is None:
-                        unrealsdk.Log(f"Null {com.GetObjectName()}.AttributeSlotEffects[{slot_index}].AttributeToModify")
+                        unrealsdk.Log(f"Null {com_name}.AttributeSlotEffects[{slot_index}].AttributeToModify")
                         continue
-                    skill_slot_map[
-                        slot_index
-                    ] = attribute_slot.AttributeToModify.GetObjectName()
+                    skill_slots.append((
+                        slot_index,
+                        attribute_slot.AttributeToModify.GetObjectName()))
                 slot_index += 1
 
     def randomize_coms(self,
@@ -1657,14 +1865,13 @@ class ClassModPatcher:
                 variable.
         """
         want_satisfied = False
-        com = None
-        for com_name, skill_slot_map in self.coms.items():
+        slots = None
+        for com_name, skill_slots in self.coms.items():
             used_skills = set()
             wanted_com_skills = 0
             if not dry_run:
-                com = unrealsdk.FindObject("ClassModDefinition", com_name)
-                pass
-            for slot_index in skill_slot_map:
+                slots = self.com_objects[com_name].AttributeSlotEffects
+            for slot_index, _ in skill_slots:
                 while True:
                     skill = rng.choice(skills)
                     if not skill.full_name in used_skills:
@@ -1673,13 +1880,10 @@ class ClassModPatcher:
                 if skill.full_name in self.wanted_class_mod_skills:
                     wanted_com_skills += 1
                 if not dry_run:
-                    com.AttributeSlotEffects[
-                        slot_index
-                    ].AttributeToModify = skill.attribute_def
-                    pass
+                    slots[slot_index].AttributeToModify = skill.attribute_def
             if wanted_com_skills == len(self.wanted_class_mod_skills):
                 unrealsdk.Log(f"{com_name} has all requested skills!")
-                if len(skill_slot_map) > 3 and len(
+                if len(skill_slots) > 3 and len(
                         self.wanted_class_mod_skills) <= 3:
                     # Legendary COM - too scarce.
                     continue
@@ -1698,12 +1902,20 @@ class ClassModPatcher:
         """
         if self.coms is None:
             return
+        # Many COMs share the same skill attributes, so look each one up only
+        # once per restore.
+        attribute_defs = {}
         for com in ClassModPatcher.iterate_coms(char_class):
-            for slot_index, attr_name in self.coms[com.GetObjectName()].items():
+            for slot_index, attr_name in self.coms[com.GetObjectName()]:
+                try:
+                    attr_def = attribute_defs[attr_name]
+                except KeyError:
+                    attr_def = unrealsdk.FindObject(
+                        "InventoryAttributeDefinition", attr_name)
+                    attribute_defs[attr_name] = attr_def
                 com.AttributeSlotEffects[
                     slot_index
-                ].AttributeToModify = unrealsdk.FindObject(
-                    "InventoryAttributeDefinition", attr_name)
+                ].AttributeToModify = attr_def
 
     # Add any skills that one of the class mods must have.  Do not specify more
     # than five skills or the game will hang.
@@ -1740,6 +1952,8 @@ class SeededPlayerRandomizer(SDKMod):
         self.config = config
         self.parent = parent
         self.pool = None
+        self.rng = random.Random(config["seed"])
+        self.rng_state = self.rng.getstate()
         self.SettingsInputs: Dict[str, str] = { "Enter" : "Enable",
                                                 "Delete" : "Remove" }
 
@@ -1808,7 +2022,9 @@ class SeededPlayerRandomizer(SDKMod):
         """
         self.parent.load_game_info()
         self.parent.skill_catalog.find_skills(self.parent.characters)
-        self.rng = random.Random(self.config["seed"])
+        # Rewind to the freshly-seeded state rather than reseeding, so every
+        # skill tree initialization replays the same choices.
+        self.rng.setstate(self.rng_state)
         self.pool = SkillPool(self.rng)
         self.pool.randomize_tree(params.SkillTreeDef,
                                  self.parent.characters,
@@ -1915,11 +2131,16 @@ class PlayerRandomizer(SDKMod):
 
     def load_packages(self) -> None:
         """
-        Force dynamically-loaded packages into memory.
+        Force dynamically-loaded packages into memory.  Only the current
+        game's packages are requested, since the others can never be found.
         """
-        for package in self.packages:
-            # If a package is missing, I think LoadPackage fails silently.
-            unrealsdk.LoadPackage(package)
+        current_game = Game.GetCurrent()
+        for games, packages in self.packages:
+            if not current_game in games:
+                continue
+            for package in packages:
+                # If a package is missing, I think LoadPackage fails silently.
+                unrealsdk.LoadPackage(package)
         
     def create_initial_options(self) -> None:
         """
@@ -2063,10 +2284,10 @@ class PlayerRandomizer(SDKMod):
             child = SeededPlayerRandomizer(parent=self, config=config)
             self.children[config["seed"]] = child
             RegisterMod(child)
-        if not self.active_child_option.CurrentValue is None:
+        active_child = self.active_child_option.CurrentValue
+        if active_child is not None:
             self.SettingsInputPressed("Disable")
-            active_mod = self.children[self.active_child_option.CurrentValue]
-            active_mod.SettingsInputPressed("Enable")
+            self.children[active_child].SettingsInputPressed("Enable")
 
     def set_active_child(self, active_child: str) -> None:
         """
@@ -2140,6 +2361,11 @@ class PlayerRandomizer(SDKMod):
         if self.randomize_com_option.CurrentValue:
             self.com_patcher.record_coms(Characters.class_from_obj_name(
                 params.SkillTreeDef.Root.GetObjectName()))
+        enabled_classes = [
+            character.character_name
+            for character in self.characters
+            if character.skill_option.CurrentValue == True
+        ]
         while True:
             # Test possible seeds for acceptability.
             # Note that this loop should try to avoid FindAll and FindObject
@@ -2147,11 +2373,7 @@ class PlayerRandomizer(SDKMod):
             # invoked too many times.
             config = {
                 "seed" : random.randrange(sys.maxsize),
-                "enabled_classes" : [
-                    character.character_name
-                    for character in self.characters
-                    if character.skill_option.CurrentValue == True
-                ],
+                "enabled_classes" : enabled_classes,
                 "hidden_skills" : self.hidden_skill_option.CurrentValue,
                 "action_skill" : self.action_skill_option.CurrentValue,
                 "skill_density" : self.skill_density_option.CurrentValue,
@@ -2190,30 +2412,31 @@ class PlayerRandomizer(SDKMod):
         """
         # By now the DLC packages should be available.  Load game data;
         self.load_game_info()
-        if not self.active_child_option.CurrentValue is None:
-            self.children[
-                self.active_child_option.CurrentValue
-            ].SettingsInputPressed("Disable")
+        active_child = self.active_child_option.CurrentValue
+        if active_child is not None:
+            self.children[active_child].SettingsInputPressed("Disable")
             self.active_child_option.CurrentValue = None
         super().Enable()
 
     # Dynamically-loaded packages that have to be in memory to randomize skills
-    packages: List[str] = [
-        # BL2
-        "GD_Assassin_Streaming_SF",
-        "GD_Mercenary_Streaming_SF",
-        "GD_Siren_Streaming_SF",
-        "GD_Lilac_Psycho_Streaming_SF",
-        "GD_Tulip_Mechro_Streaming_SF",
-        "GD_Soldier_Streaming_SF",
-
-        # TPS
-        "GD_Enforcer_Streaming_SF",
-        "GD_Gladiator_Streaming_SF",
-        "GD_Lawbringer_Streaming_SF",
-        "GD_Prototype_Streaming_SF",
-        "Quince_Doppel_Streaming_SF",
-        "Crocus_Baroness_Streaming_SF",
+    # Character packages, grouped by the games that ship them.
+    packages: List[Tuple[Game, List[str]]] = [
+        (Game.BL2 | Game.AoDK, [
+            "GD_Assassin_Streaming_SF",
+            "GD_Mercenary_Streaming_SF",
+            "GD_Siren_Streaming_SF",
+            "GD_Lilac_Psycho_Streaming_SF",
+            "GD_Tulip_Mechro_Streaming_SF",
+            "GD_Soldier_Streaming_SF",
+        ]),
+        (Game.TPS, [
+            "GD_Enforcer_Streaming_SF",
+            "GD_Gladiator_Streaming_SF",
+            "GD_Lawbringer_Streaming_SF",
+            "GD_Prototype_Streaming_SF",
+            "Quince_Doppel_Streaming_SF",
+            "Crocus_Baroness_Streaming_SF",
+        ]),
     ]
 
 parent = PlayerRandomizer()